@@ -2,6 +2,10 @@
 import sys
 import re
 import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
 # Central mapping of URLs to their corresponding title and sidebar position
 URL_TO_INFO = {
@@ -27,187 +31,209 @@ URL_TO_INFO = {
     # Add more mappings as needed
 }
 
-def clean_headings(content, pattern):
-    # Split the content into lines for processing
-    lines = content.split('\n')
-    modified_lines = []
-    
-    for line in lines:
-        # Check if the line matches the pattern
-        if line.strip().startswith('#') and pattern in line:
-            # Count the number of '#' characters at the start of the line
-            hash_count = line.count('#', 0, line.find(' '))
-            # Extract the last word from the line
-            last_word = line.split()[-1]
-            # Replace the original line with the modified version
-            modified_line = '#' * hash_count + ' ' + last_word
-            modified_lines.append(modified_line)
+def build_output_info(url_to_info):
+    """Resolve every URL once into its (title, sidebar_position, base_name, path_after_segment) tuple.
+    URLs that contain neither /api/ nor /sdk/ are skipped."""
+    output_info = {}
+    for url, info in url_to_info.items():
+        # Use consistent logic for both /api/ and /sdk/
+        if "/sdk/" in url:
+            path_after_segment = url.split("/go/")[-1]
+        elif "/api/" in url:
+            path_after_segment = url.split("/api/")[-1]
         else:
-            # If the line does not match the pattern, keep it as is
-            modified_lines.append(line)
-    
-    # Join the modified lines back into a single string
-    modified_content = '\n'.join(modified_lines)
-    return modified_content
+            continue
+        output_info[url] = (info['title'], info['sidebar_position'], "go", path_after_segment)
+    return output_info
+
+URL_OUTPUT_INFO = build_output_info(URL_TO_INFO)
+
+# Line sequences removed from the raw gomarkdoc output, the lines of each sequence may be separated by a new line
+PATTERNS_TO_DELETE = [
+    ['', '```go', 'import "."', '```', ''],
+    ['# client'],
+    ['# models'],
+    ['# dates'],
+    ['Generated by [gomarkdoc](<https://github.com/princjef/gomarkdoc>)'],
+    ['<!-- Code generated by gomarkdoc. DO NOT EDIT -->']
+]
+
+# Find-and-replace pairs applied to the raw gomarkdoc output
+MARKDOWN_REPLACEMENTS = {
+    '\n### Notes': '\n#### Notes',
+    '\n#### Notes': '\n#### Notes',
+    '#### Output': '#### Output',
+    '#### Parameters': '#### Parameters',
+    '#### Returns': '#### Returns',
+    '### Making Requests': '## Making Requests',
+    '### Setter Methods': '#### Setter Methods',
+    '### Execution Methods': '#### Execution Methods',
+    '### Methods': '#### Methods',
+    '### Generated By': '#### Generated By',
+    '</p>\n</details>': '</TabItem>'  # Generate closing MDX tabs
+}
+
+# Find-and-replace pairs applied once all the sections are in place
+TYPE_HEADING_REPLACEMENTS = {
+    '## type': '##',
+}
+
+def compile_replacements(replacements):
+    """Compile the keys of a find-and-replace dictionary into a single pattern, trying longer keys first."""
+    return re.compile('|'.join(re.escape(find) for find in sorted(replacements, key=len, reverse=True)))
+
+# Precompiled patterns shared by every processed file
+_DELETE_PATTERNS = [re.compile(r'\n?'.join(re.escape(part) for part in pattern), re.DOTALL) for pattern in PATTERNS_TO_DELETE]
+_MARKDOWN_REPLACEMENTS_RE = compile_replacements(MARKDOWN_REPLACEMENTS)
+_TYPE_HEADING_REPLACEMENTS_RE = compile_replacements(TYPE_HEADING_REPLACEMENTS)
+_ANCHOR_RE = re.compile(r'<a name="([^"]+)"></a>')
+_STRUCT_DOC_RE = re.compile(r"## type (\w+)")
+_V1_LINK_RE = re.compile(r'(\[/v1[^\]]+\])')
+_ANY_URL_RE = re.compile(r'https?://[^\s)>]+')
+# Only the URLs of URL_OUTPUT_INFO, as whole URLs (not followed by more URL characters)
+_URL_RE = re.compile('(?:' + '|'.join(re.escape(url) for url in URL_OUTPUT_INFO) + r')(?![^\s)>])')
+
+@lru_cache(maxsize=None)
+def heading_pattern(pattern):
+    """Compile the pattern matching a heading line that contains the given text, capturing its '#' prefix and its last word."""
+    return re.compile(r'^(#+) (?=.*' + re.escape(pattern) + r').*?(\S+)[^\S\n]*$', re.MULTILINE)
+
+def clean_headings(content, pattern):
+    """Reduce every heading that contains the pattern to its '#' prefix and its last word, in a single regex pass."""
+    return heading_pattern(pattern).sub(r'\1 \2', content)
+
+def has_two_backticks(line):
+    """Check if the line contains exactly two backticks, stopping at the third one."""
+    second_backtick = line.find('`', line.find('`') + 1)
+    return second_backtick != -1 and line.find('`', second_backtick + 1) == -1
 
-def colapse_bullet_points(content):
-    lines = content.split('\n')
+def colapse_bullet_points(lines):
     modified_lines = []
     i = 0
     while i < len(lines):
-        # Check if the current line meets the criteria
-        if lines[i].startswith('- ') and lines[i].count('`') == 2:
-            # Check if the next line is blank and the one after starts with two spaces
-            if i + 1 < len(lines) and lines[i + 1] == '' and i + 2 < len(lines) and lines[i + 2].startswith('  '):
-                # Concatenate the current line with the description (third line), then append
-                combined_line = lines[i] + ' ' + lines[i + 2].strip()
-                modified_lines.append(combined_line)
-                i += 3
-                continue
+        # Check if the current line meets the criteria: the next line is blank, the one after starts with two spaces,
+        # and the current line is a bullet point with exactly two backticks (checked last as it is the most expensive)
+        if (lines[i].startswith('- ') and i + 2 < len(lines) and lines[i + 1] == '' and lines[i + 2].startswith('  ')
+                and has_two_backticks(lines[i])):
+            # Concatenate the current line with the description (third line), then append
+            combined_line = lines[i] + ' ' + lines[i + 2].strip()
+            modified_lines.append(combined_line)
+            i += 3
+            continue
         # Append the current line if it doesn't meet the criteria
         modified_lines.append(lines[i])
         i += 1
-    # Join the modified lines back into a single string
-    return '\n'.join(modified_lines)
-
-def move_responses_to_top(file_content):
-    # Find all unique response struct patterns
-    response_struct_patterns = set(re.findall(r'<a name="([^"]*Response)(?=")"></a>', file_content))
-    # Find all <a name= patterns that do not match the "Response" pattern
-    non_response_patterns = set(re.findall(r'<a name="((?!Response).)*">', file_content))
-    
-    modified_content = file_content
-    for pattern in response_struct_patterns:
-        # Construct the exact start pattern for each response struct
-        start_pattern = f'<a name="{pattern}"></a>'
-        # Initialize end_pattern as None
-        end_pattern = None
-        # Find the closest non-response pattern after each response pattern
-        for non_response in non_response_patterns:
-            non_response_index = file_content.find(f'<a name="{non_response}"></a>')
-            response_index = file_content.find(start_pattern)
-            if non_response_index > response_index:
-                end_pattern = f'<a name="{non_response}"></a>'
-                break  # Break after finding the closest non-response pattern
-        
-        if end_pattern:
-            # Call move_to_top for each response struct pattern with the found end_pattern
-            modified_content = move_to_top(modified_content, start_pattern, end_pattern)
+    return modified_lines
+
+def move_responses_to_top(lines):
+    """Move the response struct sections to the top of the content.
+    A section starts at the anchor of a struct ending in 'Response' and runs until the next anchor that is not part of a response struct."""
+    moved_lines = []
+    rest_of_content = []
+    in_section = False
+
+    for line in lines:
+        # Only anchor lines can start or end a section, skip the regex for every other line
+        anchor_match = _ANCHOR_RE.match(line) if line.startswith('<a name="') else None
+        if anchor_match:
+            anchor_name = anchor_match.group(1)
+            if anchor_name.endswith('Response'):
+                in_section = True
+            elif 'Response' not in anchor_name:
+                in_section = False
+        if in_section:
+            moved_lines.append(line)
         else:
-            # If no end_pattern is found, it means this response struct is the last section
-            modified_content = move_to_top(modified_content, start_pattern, None)
-    
-    return modified_content
+            rest_of_content.append(line)
 
-def move_to_top(file_content, start_pattern, end_pattern):
-    lines = file_content.split('\n')
-    
-    sections = []
-    start_index = None
-    
-    for i, line in enumerate(lines):
-        if line.startswith(start_pattern):
-            if start_index is not None:
-                # Save the previous section if a new one starts before the old one ends
-                sections.append((start_index, i))
-            start_index = i  # Mark the start of a new section
-        elif end_pattern is not None and line.startswith(end_pattern) and start_index is not None:
-            # Mark the end of the current section and reset start_index if end_pattern is not None
-            sections.append((start_index, i))
-            start_index = None
-    
-    # If end_pattern is None, capture all the way to the end of the file from the start_pattern
-    if start_index is not None:
-        sections.append((start_index, len(lines)))
-    
-    # Extract sections and the rest of the content
-    section_contents = [lines[start:end] for start, end in sections]
-    rest_of_content = [line for i, line in enumerate(lines) if not any(start <= i < end for start, end in sections)]
-    
-    # Combine the extracted sections with the rest of the content, placing sections at the top
-    modified_content = [line for section in section_contents for line in section] + rest_of_content
-    
-    return '\n'.join(modified_content)
+    return moved_lines + rest_of_content
 
-def move_to_bottom(file_content, start_pattern, end_pattern):
-    lines = file_content.split('\n')
-    
-    sections = []
-    start_index = None
-    
-    for i, line in enumerate(lines):
+def split_sections(lines, start_pattern, end_pattern):
+    """Split the lines into the sections running from start_pattern up to end_pattern and the rest of the content.
+    If end_pattern is None, a section runs to the end of the content."""
+    section_lines = []
+    rest_of_content = []
+    in_section = False
+
+    for line in lines:
         if line.startswith(start_pattern):
-            if start_index is not None:
-                # Save the previous section if a new one starts before the old one ends
-                sections.append((start_index, i))
-            start_index = i  # Mark the start of a new section
-        elif line.startswith(end_pattern) and start_index is not None:
-            # Mark the end of the current section and reset start_index
-            sections.append((start_index, i))
-            start_index = None
-    
-    # Check if the last section goes until the end of the file
-    if start_index is not None:
-        sections.append((start_index, len(lines)))
-    
-    # Extract sections and the rest of the content
-    section_contents = [lines[start:end] for start, end in sections]
-    rest_of_content = [line for i, line in enumerate(lines) if not any(start <= i < end for start, end in sections)]
-    
-    # Combine the rest of the content with the extracted sections
-    modified_content = rest_of_content + [line for section in section_contents for line in section]
-    
-    return '\n'.join(modified_content)
+            in_section = True
+        elif in_section and end_pattern is not None and line.startswith(end_pattern):
+            in_section = False
+        if in_section:
+            section_lines.append(line)
+        else:
+            rest_of_content.append(line)
+
+    return section_lines, rest_of_content
 
+def move_to_top(lines, start_pattern, end_pattern):
+    section_lines, rest_of_content = split_sections(lines, start_pattern, end_pattern)
+    # Place the extracted sections above the rest of the content
+    return section_lines + rest_of_content
 
-def find_method_blocks_and_relocate(content):
-    lines = content.split('\n')
+def move_to_bottom(lines, start_pattern, end_pattern):
+    section_lines, rest_of_content = split_sections(lines, start_pattern, end_pattern)
+    # Place the extracted sections below the rest of the content
+    return rest_of_content + section_lines
+
+
+def find_method_blocks_and_relocate(lines):
+    lines = list(lines)
     method_suffixes = [".Get", ".Raw", ".Packed"]
     method_blocks = {}
     type_definition_found = False
-    type_end_loop = False
     type_name = ""
     type_end_line = 0
     first_method_line_number = None  # Initialize variable to track the first method line number
 
+    # Line numbers of all anchors in order, so a method block ends right before the next entry,
+    # and of all type headings, so the end of the type definition is found by bisection
+    anchor_line_numbers = []
+    type_heading_line_numbers = []
     for i, line in enumerate(lines):
-        stripped_line = line.strip()
-
-        if not type_definition_found and stripped_line.startswith('<a') and "Request" in stripped_line:
-            type_definition_found = True
-            type_name = stripped_line.split('"')[1]
+        if line.lstrip().startswith('<a'):
+            anchor_line_numbers.append(i)
+        if "## type" in line:
+            type_heading_line_numbers.append(i)
+
+    for k, i in enumerate(anchor_line_numbers):
+        stripped_line = lines[i].strip()
+
+        if not type_definition_found:
+            if "Request" in stripped_line:
+                type_definition_found = True
+                type_name = stripped_line.split('"')[1]
+                method_prefix = f'<a name="{type_name}.'
+                # Map the anchors of the methods to relocate to their suffix
+                method_anchors = {f'<a name="{type_name}{method_suffix}"></a>': method_suffix for method_suffix in method_suffixes}
+                # The type definition ends at the next type heading after the line following its anchor
+                if i + 1 < len(lines):
+                    next_heading = bisect_right(type_heading_line_numbers, i + 1)
+                    if next_heading < len(type_heading_line_numbers):
+                        type_end_line = type_heading_line_numbers[next_heading]
+                    else:
+                        type_end_line = len(lines) - 1
             continue
 
-        if type_definition_found and not type_end_loop:
-            for j in range(i+1, len(lines)):
-                if "## type" in lines[j]:
-                    type_end_line = j
-                    break
-            else:
-                type_end_line = len(lines) - 1
-            type_end_loop = True
-
         # Check if the line is a method of the current type_name
-        if type_definition_found and stripped_line.startswith(f'<a name="{type_name}.'):
+        if stripped_line.startswith(method_prefix):
             start_line_number = i
-            for j in range(i+1, len(lines)):
-                if lines[j].strip().startswith('<a'):
-                    end_line_number = j - 1
-                    break
+            if k + 1 < len(anchor_line_numbers):
+                end_line_number = anchor_line_numbers[k + 1] - 1
             # Update first_method_line_number if this is the first method found
-            if first_method_line_number is None or start_line_number < first_method_line_number:
+            if first_method_line_number is None:
                 first_method_line_number = start_line_number
 
             # Check if the method matches one of the specific suffixes for relocation
-            for method_suffix in method_suffixes:
-                if f'<a name="{type_name}{method_suffix}"></a>' in stripped_line:
-                    method_blocks[method_suffix] = {
-                        'type_name': type_name,
-                        'start_line_number': start_line_number,
-                        'end_line_number': end_line_number,
-                        'content': '\n'.join(lines[start_line_number:end_line_number+1])
-                    }
-                    break
+            method_suffix = method_anchors.get(stripped_line)
+            if method_suffix is not None:
+                method_blocks[method_suffix] = {
+                    'type_name': type_name,
+                    'start_line_number': start_line_number,
+                    'end_line_number': end_line_number,
+                    'content': '\n'.join(lines[start_line_number:end_line_number+1])
+                }
 
     # Sort the method blocks in the specified order
     sorted_methods = sorted(method_blocks.items(), key=lambda x: [".Get", ".Packed", ".Raw"].index(x[0]))
@@ -231,13 +257,13 @@ def find_method_blocks_and_relocate(content):
         setter_methods_header = f"## {type_name} Setter Methods"
         lines.insert(first_method_line_number - 1, setter_methods_header)
 
-    return '\n'.join(lines)
+    # The relocated method blocks were inserted as single entries, split them back into lines
+    return [split_line for line in lines for split_line in line.split('\n')]
 
-def remove_code_block_delimiters(content, section_title):
+def remove_code_block_delimiters(lines, section_title):
     """
     Find the section by title and remove the first two occurrences of code block delimiters (```) after the section title.
     """
-    lines = content.split('\n')
     new_lines = []
     in_section = False
     code_block_delimiters_removed = 0
@@ -254,13 +280,11 @@ def remove_code_block_delimiters(content, section_title):
         if code_block_delimiters_removed == 2:
             in_section = False
 
-    return '\n'.join(new_lines)
+    return new_lines
 
 
-def remove_first_sentence(content):
+def remove_first_sentence(lines):
     """Remove the first sentence from the content, searching from top to bottom for a line that begins with 'Package client'."""
-    # Split the content into lines
-    lines = content.split('\n')
     new_lines = []
     found = False
 
@@ -277,101 +301,146 @@ def remove_first_sentence(content):
                 continue
         new_lines.append(line)
 
-    return '\n'.join(new_lines)
-
-def add_anchor_tags(content, sections_to_process):
-    """Process the parameters block of text as specified, including 'Setter Methods' and 'Execution Methods'. 
-    Insert <a href="#"> before and </a> after lines that start with a dash (-)."""
-    lines = content.split('\n')
+    return new_lines
+
+def format_header_block_line(line):
+    """Format a dash line of a header block as a backticked signature followed by its indented description, returned as lines."""
+    # Step 1: Add a backtick after the dash and before the first colon
+    line = line.replace('- ', '- `', 1)
+    # Step 2: Replace the first colon with two new lines and two spaces
+    line = line.replace(':', '`\n\n ', 1)
+    # Step 3: Now, remove escape characters only between the backticks we've just added
+    parts = line.split('`')
+    if len(parts) > 2:  # Ensure there are backticks to process
+        parts[1] = parts[1].replace('\\', '')  # Remove escape characters only in the part between backticks
+        line = '`'.join(parts)
+    # Step 4: Add an additional new line at the end
+    line += '\n'
+    return line.split('\n')
+
+def process_sections(lines, blocks_to_process, sections_to_process):
+    """Process the parameters block of text as specified, including 'Setter Methods' and 'Execution Methods',
+    and insert <a href="#"> before and </a> after the lines that start with a dash (-) in sections_to_process.
+    Both are done in a single pass: the lines produced by the header block processing are anchor tagged right away."""
     processed_lines = []
+    in_header_block = False
+    found_first_header_dash = False  # Variable to track the first dash of a header block
     processing = False
-    found_first_dash = False  # Variable to track the first dash
+    found_first_dash = False  # Variable to track the first dash of a section to anchor tag
+    current_type_word = ""  # Name from the closest preceding type definition
 
     for line in lines:
-        if (match := line.strip()) in sections_to_process:
-            processing = True
-            matched_string = match  # Keep track of which string matched
-            found_first_dash = False  # Reset for each new section
-            processed_lines.append(line)
-            continue
-        if processing:
-            if not found_first_dash:
-                if line.strip() == '':
-                    processed_lines.append(line)
-                    continue
-                elif not line.lstrip().startswith('-'):
-                    processed_lines.append(line)
-                    continue
-                else:
-                    found_first_dash = True  # Found the first dash, start processing lines
-            if line.startswith('-'):
-                if matched_string != '#### Generated By':
-                    previous_lines = lines[:lines.index(line)]
-                    type_word = ""
-                    for prev_line in reversed(previous_lines):
-                        if prev_line.strip().startswith("type "):
-                            type_word = prev_line.split()[1]
-                            break
-                    anchor = line[line.find('`')+1:line.find('(')].strip()
-                    # Insert <a href="#"> before and </a> after the line
-                    processed_lines.append('- ' + f'<a href="#{type_word}.{anchor}">' +'`' + line[3:] + '</a>')
-                else:
-                    anchor = line[line.find('`')+1:line.find('(')].strip()
-                    # Insert <a href="#"> before and </a> after the line
-                    processed_lines.append('- ' + f'<a href="#{anchor}">' +'`' + line[3:] + '</a>')
-            elif line.strip() == '' or line.startswith('  '):
-                processed_lines.append(line)
+        # Process the header blocks
+        stripped_line = line.strip()
+        if stripped_line in blocks_to_process:
+            in_header_block = True
+            found_first_header_dash = False  # Reset for each new section
+            header_lines = [line]
+        elif in_header_block and line.startswith('-'):
+            found_first_header_dash = True
+            header_lines = format_header_block_line(line)
+        else:
+            if in_header_block and found_first_header_dash:
+                # Stop processing if the line does not start with a dash
+                in_header_block = False
+            header_lines = [line]
+
+        # Add the anchor tags to the resulting lines
+        for header_line in header_lines:
+            stripped_line = header_line.strip()
+            if stripped_line.startswith("type "):
+                current_type_word = header_line.split()[1]
+            if stripped_line in sections_to_process:
+                processing = True
+                matched_string = stripped_line  # Keep track of which string matched
+                found_first_dash = False  # Reset for each new section
+                processed_lines.append(header_line)
                 continue
+            if processing:
+                if not found_first_dash:
+                    if stripped_line == '':
+                        processed_lines.append(header_line)
+                        continue
+                    elif not stripped_line.startswith('-'):
+                        processed_lines.append(header_line)
+                        continue
+                    else:
+                        found_first_dash = True  # Found the first dash, start processing lines
+                if header_line.startswith('-'):
+                    anchor = header_line[header_line.find('`')+1:header_line.find('(')].strip()
+                    if matched_string != '#### Generated By':
+                        anchor = f'{current_type_word}.{anchor}'
+                    # Insert <a href="#"> before and </a> after the header_line
+                    processed_lines.append(f'- <a href="#{anchor}">`{header_line[3:]}</a>')
+                elif stripped_line == '' or header_line.startswith('  '):
+                    processed_lines.append(header_line)
+                else:
+                    # Stop processing if the header_line does not start with a dash
+                    processing = False
+                    processed_lines.append(header_line)
             else:
-                # Stop processing if the line does not start with a dash
-                processing = False
-                processed_lines.append(line)
-        else:
-            processed_lines.append(line)
+                processed_lines.append(header_line)
 
-    return '\n'.join(processed_lines)
+    return processed_lines
 
-def move_all_struct_definitions(content):
+def move_all_struct_definitions(lines):
     """Move all struct definition blocks right after their type documentation."""
-    import re
 
-    # Pattern to find struct type documentation
-    struct_doc_pattern = re.compile(r"## type (\w+)")
-    # Pattern to find struct definition blocks
-    struct_def_pattern_template = r"(```go\s+type {}\s.*?```)"
-    
-    # Find all struct names from the documentation
-    struct_names = struct_doc_pattern.findall(content)
-
-    for struct_name in struct_names:
-        # Create a pattern for the current struct definition
-        struct_def_pattern = re.compile(struct_def_pattern_template.format(struct_name), re.DOTALL)
-        
-        # Find the struct definition block
-        struct_def_match = struct_def_pattern.search(content)
-        if not struct_def_match:
-            continue  # Skip if struct definition block not found
-
-        struct_def_block = struct_def_match.group(1)
-
-        # Remove the original struct definition block from the content
-        content = struct_def_pattern.sub('', content, count=1)
-
-        # Insert the struct definition block right after the struct type documentation
-        content = re.sub(
-            rf"(## type {struct_name}\s*\n)",
-            r'\1' + struct_def_block + '\n\n',
-            content,
-            count=1
-        )
+    # Index the struct type documentation headings and the struct definition blocks in a single scan
+    doc_index = {}
+    block_index = {}
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        doc_match = _STRUCT_DOC_RE.search(line)
+        if doc_match and not line[doc_match.end():].strip():
+            doc_index.setdefault(doc_match.group(1), i)
+        elif line.strip() == '```go' and i + 1 < len(lines):
+            words = lines[i + 1].split()
+            if len(words) > 1 and words[0] == 'type':
+                # The definition block runs until the next code block delimiter
+                end = i + 2
+                while end < len(lines) and '```' not in lines[end]:
+                    end += 1
+                if end < len(lines):
+                    block_index.setdefault(words[1], (i, end))
+                    i = end
+        i += 1
 
-    return content
+    # Only the blocks whose struct has type documentation are moved
+    blocks_to_insert = {}
+    blocks_to_remove = {}
+    for struct_name, doc_line in doc_index.items():
+        if struct_name in block_index:
+            start, end = block_index[struct_name]
+            blocks_to_insert[doc_line] = lines[start:end + 1]
+            blocks_to_remove[start] = end
+
+    modified_lines = []
+    pending_block = None
+    i = 0
+    while i < len(lines):
+        # A removed block leaves a single empty line behind
+        if i in blocks_to_remove:
+            line = ''
+            next_i = blocks_to_remove[i] + 1
+        else:
+            line = lines[i]
+            next_i = i + 1
+        # The block goes after the documentation heading and the blank lines that follow it
+        if pending_block is not None and (line.strip() or next_i >= len(lines)):
+            modified_lines.extend(pending_block)
+            modified_lines.append('')
+            pending_block = None
+        modified_lines.append(line)
+        if i in blocks_to_insert:
+            pending_block = blocks_to_insert[i]
+        i = next_i
+
+    return modified_lines
 
 def correct_escaping_in_links(content):
     """Correct escaping in markdown links that start with [/v1 and enclose URL text in backticks if it contains { or }."""
-    # Regular expression to match the pattern
-    pattern = re.compile(r'(\[/v1[^\]]+\])')
-    
     def remove_escapes_and_check_braces(match):
         # Remove backslashes from the matched string
         cleaned_match = match.group(0).replace('\\', '')
@@ -383,12 +452,11 @@ def correct_escaping_in_links(content):
     
     # Replace all occurrences of the pattern with their escaped characters removed
     # and check for { or } to enclose in backticks
-    corrected_content = re.sub(pattern, remove_escapes_and_check_braces, content)
+    corrected_content = _V1_LINK_RE.sub(remove_escapes_and_check_braces, content)
     return corrected_content
 
-def remove_index_block(content):
+def remove_index_block(lines):
     """Remove the index block from the markdown content, starting after the first new line after '## Index'."""
-    lines = content.split('\n')
     new_lines = []
     in_index_block = False
     past_first_new_line = False  # Track if we're past the first new line after '## Index'
@@ -397,113 +465,86 @@ def remove_index_block(content):
         if line.startswith('## Index'):
             in_index_block = True
             continue
-        if in_index_block and not past_first_new_line:
-            if line.strip() == '':
-                past_first_new_line = True  # We're past the first new line, start processing next lines
-            continue  # Skip until we're past the first new line
-        if in_index_block:
-            if line.strip() == '' or not line.lstrip().startswith('-'):
-                in_index_block = False  # End of index block
-                continue
-        else:
+        if not in_index_block:
             new_lines.append(line)
-
-    return '\n'.join(new_lines)
-
-def process_header_blocks(content, blocks_to_process):
-    """Process the parameters block of text as specified, including 'Setter Methods' and 'Execution Methods'."""
-    lines = content.split('\n')
-    processed_lines = []
-    processing = False
-    found_first_dash = False  # New variable to track the first dash
-
-    for line in lines:
-        if line.strip() in blocks_to_process:
-            processing = True
-            found_first_dash = False  # Reset for each new section
-            processed_lines.append(line)
             continue
-        if processing:
-            if not found_first_dash:
-                if line.strip() == '':
-                    processed_lines.append(line)
-                    continue
-                elif not line.startswith('-'):
-                    processed_lines.append(line)
-                    continue
-                else:
-                    found_first_dash = True  # Found the first dash, start processing lines
-            if line.startswith('-'):
-                # Step 1: Add a backtick after the dash and before the first colon
-                line = line.replace('- ', '- `', 1)
-                # Step 2: Replace the first colon with two new lines and two spaces
-                line = line.replace(':', '`\n\n ', 1)
-                # Step 3: Now, remove escape characters only between the backticks we've just added
-                parts = line.split('`')
-                if len(parts) > 2:  # Ensure there are backticks to process
-                    parts[1] = parts[1].replace('\\', '')  # Remove escape characters only in the part between backticks
-                    line = '`'.join(parts)
-                # Step 4: Add an additional new line at the end
-                line += '\n'
-                processed_lines.append(line)
-            else:
-                # Stop processing if the line does not start with a dash
-                processing = False
-                processed_lines.append(line)
-        else:
-            processed_lines.append(line)
-
-    return '\n'.join(processed_lines)
+        stripped_line = line.strip()  # Only lines of the index block need stripping
+        if not past_first_new_line:
+            if stripped_line == '':
+                past_first_new_line = True  # We're past the first new line, start processing next lines
+            continue  # Skip until we're past the first new line
+        if stripped_line == '' or not stripped_line.startswith('-'):
+            in_index_block = False  # End of index block
+
+    return new_lines
+
+def replace_delimited_blocks(content, start_marker, end_marker, make_replacement):
+    """Replace every block running from start_marker to the closest following end_marker with make_replacement(text between the markers).
+    Scans the content once with str.find, like a non-greedy regex substitution but without any backtracking."""
+    parts = []
+    position = 0
+    while True:
+        start = content.find(start_marker, position)
+        if start == -1:
+            break
+        end = content.find(end_marker, start + len(start_marker))
+        if end == -1:
+            break  # No later block can be closed either
+        parts.append(content[position:start])
+        parts.append(make_replacement(content[start + len(start_marker):end]))
+        position = end + len(end_marker)
+    parts.append(content[position:])
+    return ''.join(parts)
 
 def remove_output_blocks(content):
     """Remove blocks of text starting with '// Output:' and ending with '```', including the start line but not the end line."""
-    output_pattern = re.compile(r'// Output:.*?```', re.DOTALL)
     # Replace the found blocks with just '```' to keep the ending line
-    cleaned_content = re.sub(output_pattern, '```', content)
-    return cleaned_content
+    return replace_delimited_blocks(content, '// Output:', '```', lambda output: '```')
 
-def add_tabs_tags(content):
+def add_tabs_tags(lines):
     """Add opening and closing <Tabs> tags around groups of <TabItem> tags, considering blank lines."""
-    lines = content.split('\n')
     new_lines = []
     in_tab_group = False
+    trimmed_lines = [line.strip() for line in lines]
 
-    def is_next_non_blank_line_tabitem(start_index, direction):
-        """Check if the next non-blank line in the given direction (1 for forward, -1 for backward) is a <TabItem> line."""
-        index = start_index + direction
-        while 0 <= index < len(lines) and lines[index].strip() == '':
-            index += direction
-        if 0 <= index < len(lines):
-            return lines[index].strip().startswith('<TabItem') if direction == 1 else lines[index].strip().endswith('</TabItem>')
-        return False
+    # Index of the next non-blank line after each line (-1 if there is none), filled from the end in one pass
+    next_non_blank = [-1] * len(lines)
+    index = -1
+    for i in range(len(lines) - 1, -1, -1):
+        next_non_blank[i] = index
+        if trimmed_lines[i] != '':
+            index = i
 
+    previous_non_blank = -1  # Index of the previous non-blank line, tracked while iterating
     for i, line in enumerate(lines):
-        trimmed_line = line.strip()
+        trimmed_line = trimmed_lines[i]
         # Check for opening <TabItem> without preceding closing </TabItem>
-        if trimmed_line.startswith('<TabItem') and not is_next_non_blank_line_tabitem(i, -1):
+        if trimmed_line.startswith('<TabItem') and not (previous_non_blank != -1 and trimmed_lines[previous_non_blank].endswith('</TabItem>')):
             if not in_tab_group:
                 new_lines.append('<Tabs>')
                 in_tab_group = True
         new_lines.append(line)
         # Check for closing </TabItem> without following opening <TabItem>
-        if trimmed_line.endswith('</TabItem>') and not is_next_non_blank_line_tabitem(i, 1):
+        if trimmed_line.endswith('</TabItem>') and not (next_non_blank[i] != -1 and trimmed_lines[next_non_blank[i]].startswith('<TabItem')):
             if in_tab_group:
                 new_lines.append('</Tabs>')
                 in_tab_group = False
+        if trimmed_line != '':
+            previous_non_blank = i
 
-    return '\n'.join(new_lines)
+    return new_lines
 
 def convert_details_to_tabitem(content):
     """Convert <details> tags to <TabItem> with dynamic attributes based on the summary content, and remove the trailing <p>."""
-    detail_pattern = re.compile(
-        r'<details><summary>(.*?)</summary>\n<p>',
-        re.DOTALL
-    )
-    return re.sub(detail_pattern, r'<TabItem value="\1" label="\1">\n', content)
+    return replace_delimited_blocks(content, '<details><summary>', '</summary>\n<p>', lambda summary: f'<TabItem value="{summary}" label="{summary}">\n')
+
 def read_file_content(file_path):
     """Read and return the content of the file."""
     try:
-        with open(file_path, 'r') as file:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            if hasattr(os, 'posix_fadvise'):
+                # The file is read once from start to end, let the kernel read ahead
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
             return file.read()
     except FileNotFoundError:
         print(f"Error: The file {file_path} was not found.")
@@ -511,79 +552,54 @@ def read_file_content(file_path):
 
 def write_file_content(file_path, content):
     """Write the given content to the file."""
-    with open(file_path, 'w') as file:
-        file.write(content)
+    Path(file_path).write_text(content, encoding='utf-8')
 
 def remove_pattern(content, patterns):
-    """Remove all occurrences of the patterns from the content."""
+    """Remove the first occurrence of each of the compiled patterns from the content."""
     for pattern in patterns:
-        pattern_str = r'\n?'.join([re.escape(part) for part in pattern])
-        pattern_re = re.compile(pattern_str, re.DOTALL)
-        content = re.sub(pattern_re, '', content, 1)
+        content = pattern.sub('', content, count=1)
     return content
 
-def replace_pattern(content, replacements):
-    """Replace occurrences based on a dictionary of find-and-replace pairs."""
-    for find, replace in replacements.items():
-        content = content.replace(find, replace)
-    return content
+def replace_pattern(content, replacements, replacements_re):
+    """Replace occurrences based on a dictionary of find-and-replace pairs, in a single pass using its compiled pattern."""
+    return replacements_re.sub(lambda match: replacements[match.group(0)], content)
 
 def process_file(file_path):
     """Process the file to remove specified patterns, replace specified strings, and convert <details> to <TabItem>, including removing the trailing <p>."""
     content = read_file_content(file_path)
     if content is not None:
-        patterns_to_delete = [
-            ['', '```go', 'import "."', '```', ''],
-            ['# client'],
-            ['# models'],
-            ['# dates'],
-            ['Generated by [gomarkdoc](<https://github.com/princjef/gomarkdoc>)'],
-            ['<!-- Code generated by gomarkdoc. DO NOT EDIT -->']
-        ]
-        content = remove_pattern(content, patterns_to_delete)
-
-        replacements = {
-        '\n### Notes': '\n#### Notes',
-        '\n#### Notes': '\n#### Notes',
-        '#### Output': '#### Output',
-        '#### Parameters': '#### Parameters',
-        '#### Returns': '#### Returns',
-        '### Making Requests': '## Making Requests',
-        '### Setter Methods': '#### Setter Methods',
-        '### Execution Methods': '#### Execution Methods',
-        '### Methods': '#### Methods',
-        '### Generated By': '#### Generated By',
-        '</p>\n</details>': '</TabItem>'  # Generate closing MDX tabs
-        }
-        content = replace_pattern(content, replacements)
-
-        content = remove_first_sentence(content)
+        content = remove_pattern(content, _DELETE_PATTERNS)
+
+        content = replace_pattern(content, MARKDOWN_REPLACEMENTS, _MARKDOWN_REPLACEMENTS_RE)
+
         content = convert_details_to_tabitem(content)  # Convert <details> to <TabItem> and remove trailing <p>
-        content = add_tabs_tags(content)  # Add <Tabs> and </Tabs> tags
         content = remove_output_blocks(content)  # Remove output blocks
+        content = correct_escaping_in_links(content)  # Correct escaping in links
 
-        blocks_to_process = ['#### Parameters','#### Returns', '#### Setter Methods', '#### Execution Methods', '#### Methods', '#### Generated By']    
-        content = process_header_blocks(content, blocks_to_process)  # Process header blocks
+        # The remaining passes work line by line, so the content is split only once
+        lines = content.split('\n')
+        lines = remove_first_sentence(lines)
+        lines = add_tabs_tags(lines)  # Add <Tabs> and </Tabs> tags
 
-        content = remove_index_block(content)  # Remove index block
-        content = correct_escaping_in_links(content)  # Correct escaping in links
-        content = move_all_struct_definitions(content) # Move all struct definitions
+        lines = remove_index_block(lines)  # Remove index block
+        lines = move_all_struct_definitions(lines) # Move all struct definitions
 
+        # Process header blocks and add anchor tags to their methods in one pass
+        blocks_to_process = ['#### Parameters','#### Returns', '#### Setter Methods', '#### Execution Methods', '#### Methods', '#### Generated By']
         sections_to_process = ['#### Setter Methods', '#### Execution Methods', '#### Methods', '#### Generated By']
-        content = add_anchor_tags(content, sections_to_process)
+        lines = process_sections(lines, blocks_to_process, sections_to_process)
 
-        content = remove_code_block_delimiters(content, "## Making Requests")
-        content = find_method_blocks_and_relocate(content)
-        content = move_responses_to_top(content)
-        #content = move_to_bottom(content, '<a name="Candle','<a' )
-        content = move_to_bottom(content, '<a name="By','<a' )
-        content = move_to_bottom(content, '<a name="LogEntry"></a>', '<a name="MarketDataLogs"></a>')
-        # content = colapse_bullet_points(content)
+        lines = remove_code_block_delimiters(lines, "## Making Requests")
+        lines = find_method_blocks_and_relocate(lines)
+        lines = move_responses_to_top(lines)
+        #lines = move_to_bottom(lines, '<a name="Candle','<a' )
+        lines = move_to_bottom(lines, '<a name="By','<a' )
+        lines = move_to_bottom(lines, '<a name="LogEntry"></a>', '<a name="MarketDataLogs"></a>')
+        # lines = colapse_bullet_points(lines)
 
-        replacements = {
-        '## type': '##',
-        }
-        content = replace_pattern(content, replacements)
+        # The final passes are regex substitutions, so the lines are joined back first
+        content = '\n'.join(lines)
+        content = replace_pattern(content, TYPE_HEADING_REPLACEMENTS, _TYPE_HEADING_REPLACEMENTS_RE)
 
         content = clean_headings(content, 'func')
 
@@ -594,39 +610,29 @@ def process_file(file_path):
 
 def combine_files_into_mdx(file_paths):
     """Prepare the combined content of multiple files."""
-    combined_content = ""
-    for file_path in file_paths:
-        try:
-            with open(file_path, 'r') as file:
-                combined_content += file.read() + "\n\n"
-        except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
-            return None, None
+    parts = []
+    try:
+        for file_path in file_paths:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                parts.append(file.read())
+    except Exception as e:
+        print(f"Error reading file {file_path}: {e}")
+        return None, None
+    # Every file is followed by a blank line
+    combined_content = "\n\n".join(parts) + "\n\n"
 
-    global URL_TO_INFO
-    urls_found = re.findall(r'https?://[^\s)>]+', combined_content)
-    urls_to_process = [url for url in urls_found if url in URL_TO_INFO]
+    # Only the first URL of URL_TO_INFO found in the content is used
+    url_match = _URL_RE.search(combined_content)
 
-    if not urls_to_process:
+    if not url_match:
+        urls_found = _ANY_URL_RE.findall(combined_content)
         print(f"Error: No URLs matching URL_TO_INFO found in the combined content.\nURLs found: {urls_found}\nURLs expected but not found: {[url for url in URL_TO_INFO.keys() if url not in urls_found]}")
         sys.exit(1)  # Exit the script if no matching URLs are found
 
-    for url in urls_to_process:
-        info = URL_TO_INFO.get(url)
-        if info:
-            header_text = f"---\ntitle: {info['title']}\nsidebar_position: {info['sidebar_position']}\n---\n\n"
-            combined_content = header_text + combined_content
-            # Use consistent logic for both /api/ and /sdk/
-            if "/sdk/" in url:
-                base_name = "go"
-                path_after_segment = url.split("/go/")[-1]
-            elif "/api/" in url:
-                base_name = "go"
-                path_after_segment = url.split("/api/")[-1]
-            else:
-                continue  # Skip if URL does not contain /api/ or /sdk/
-            output_filename = f"{base_name}/{path_after_segment}.mdx"
-            break  # Exit the loop after processing the first matching URL
+    title, sidebar_position, base_name, path_after_segment = URL_OUTPUT_INFO[url_match.group(0)]
+    header_text = f"---\ntitle: {title}\nsidebar_position: {sidebar_position}\n---\n\n"
+    combined_content = header_text + combined_content
+    output_filename = f"{base_name}/{path_after_segment}.mdx"
 
     if "<Tabs>" in combined_content:
         import_statements = "import Tabs from \"@theme/Tabs\";\nimport TabItem from \"@theme/TabItem\";\n\n"
@@ -660,8 +666,13 @@ if __name__ == "__main__":
         print("Usage: ./process_markdown.py <file_path> [<file_path> ...]")
         sys.exit(1)
     
-    for file_path in sys.argv[1:]:
-        process_file(file_path)    
+    if len(sys.argv[1:]) == 1:
+        # A single file is not worth the start-up cost of a process pool
+        process_file(sys.argv[1])
+    else:
+        # Files are processed independently, so spread them over all cores
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(process_file, sys.argv[1:]))
     # Combine all processed files into a single .mdx file
     process_file_paths = sys.argv[1:]  # Assuming these are the paths of processed files
     combined_content, output_filename = combine_files_into_mdx(process_file_paths)